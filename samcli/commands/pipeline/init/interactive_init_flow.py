@@ -2,29 +2,31 @@
 Interactive flow that prompts that users for pipeline template (cookiecutter template) and used it to generate
 pipeline configuration file
 """
+import hashlib
 import json
 import logging
 import os
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from json import JSONDecodeError
 from pathlib import Path
 from textwrap import dedent
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import click
 from samcli.cli.global_config import GlobalConfig
 
 from samcli.commands.exceptions import (
+    AppPipelineTemplateManifestException,
     AppPipelineTemplateMetadataException,
     PipelineTemplateCloneException,
 )
 from samcli.lib.config.samconfig import SamConfig
 from samcli.lib.cookiecutter.interactive_flow import InteractiveFlow
-from samcli.lib.cookiecutter.interactive_flow_creator import InteractiveFlowCreator
 from samcli.lib.cookiecutter.question import Choice
-from samcli.lib.cookiecutter.template import Template
 from samcli.lib.utils import osutils
 from samcli.lib.utils.colors import Colored
-from samcli.lib.utils.git_repo import GitRepo, CloneRepoException
+from samcli.lib.utils.hash import file_checksum
 from .pipeline_templates_manifest import Provider, PipelineTemplateMetadata, PipelineTemplatesManifest
 from ..bootstrap.cli import (
     do_cli as do_bootstrap,
@@ -33,13 +35,49 @@ from ..bootstrap.cli import (
     _get_bootstrap_command_names,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    # cookiecutter and jinja2 are only imported once a pipeline template is used
+    from samcli.lib.cookiecutter.template import Template
+
 LOG = logging.getLogger(__name__)
 shared_path: Path = GlobalConfig().config_dir
 APP_PIPELINE_TEMPLATES_REPO_URL = "https://github.com/aws/aws-sam-cli-pipeline-init-templates.git"
 APP_PIPELINE_TEMPLATES_REPO_LOCAL_NAME = "aws-sam-cli-app-pipeline-templates"
+APP_PIPELINE_TEMPLATES_REPO_MIRROR_NAME = "aws-sam-cli-app-pipeline-templates.git"
+APP_PIPELINE_TEMPLATES_MANIFEST_CACHE_NAME = "aws-sam-cli-app-pipeline-templates.manifest.cache.json"
 CUSTOM_PIPELINE_TEMPLATE_REPO_LOCAL_NAME = "custom-pipeline-template"
 SAM_PIPELINE_TEMPLATE_SOURCE = "AWS Quick Start Pipeline Templates"
 CUSTOM_PIPELINE_TEMPLATE_SOURCE = "Custom Pipeline Template Location"
+INTRO_MESSAGE = dedent(
+    """\
+
+    sam pipeline init generates a pipeline configuration file that your CI/CD system
+    can use to deploy serverless applications using AWS SAM.
+    We will guide you through the process to bootstrap resources for each stage,
+    then walk through the details necessary for creating the pipeline config file.
+
+    Please ensure you are in the root folder of your SAM application before you begin.
+    """
+)
+BOOTSTRAP_INTRO_MESSAGE = dedent(
+    """\
+
+    For each stage, we will ask for [1] stage definition, [2] account details, and [3]
+    reference application build resources in order to bootstrap these pipeline
+    resources.
+
+    We recommend using an individual AWS account profiles for each stage in your
+    pipeline. You can set these profiles up using aws configure or ~/.aws/credentials. See
+    [https://docs.aws.amazon.com/serverless-application-model/latest/developerguide/serverless-getting-started-set-up-credentials.html].
+    """  # pylint: disable=C0301
+)
+BOOTSTRAP_HINT_MESSAGE = dedent(
+    """\
+    To set up stage(s), please quit the process using Ctrl+C and use one of the following commands:
+    sam pipeline init --bootstrap       To be guided through the stage and config file creation process.
+    sam pipeline bootstrap              To specify details for an individual stage.
+    """
+)
 
 
 class InteractiveInitFlow:
@@ -53,19 +91,7 @@ class InteractiveInitFlow:
         runs its specific questionnaire then generates the pipeline config file
         based on the template and user's responses
         """
-        click.echo(
-            dedent(
-                """\
-
-                sam pipeline init generates a pipeline configuration file that your CI/CD system
-                can use to deploy serverless applications using AWS SAM.
-                We will guide you through the process to bootstrap resources for each stage,
-                then walk through the details necessary for creating the pipeline config file.
-
-                Please ensure you are in the root folder of your SAM application before you begin.
-                """
-            )
-        )
+        click.echo(INTRO_MESSAGE)
 
         pipeline_template_source_question = Choice(
             key="pipeline-template-source",
@@ -78,9 +104,9 @@ class InteractiveInitFlow:
             generated_files = self._generate_from_custom_location()
         else:
             generated_files = self._generate_from_app_pipeline_templates()
-        click.secho(Colored().green("Successfully created the pipeline configuration file(s):"))
+        click.secho(self.color.green("Successfully created the pipeline configuration file(s):"))
         for file in generated_files:
-            click.secho(Colored().green(f"\t- {file}"))
+            click.secho(self.color.green(f"\t- {file}"))
 
     def _generate_from_app_pipeline_templates(
         self,
@@ -91,18 +117,21 @@ class InteractiveInitFlow:
         downloads locally, then generates the pipeline configuration file from the selected pipeline template.
         Finally, return the list of generated files.
         """
-        pipeline_templates_local_dir: Path = _clone_app_pipeline_templates()
-        pipeline_templates_manifest: PipelineTemplatesManifest = _read_app_pipeline_templates_manifest(
-            pipeline_templates_local_dir
-        )
-        # The manifest contains multiple pipeline-templates so select one
-        selected_pipeline_template_metadata: PipelineTemplateMetadata = _prompt_pipeline_template(
-            pipeline_templates_manifest
-        )
-        selected_pipeline_template_dir: Path = pipeline_templates_local_dir.joinpath(
-            selected_pipeline_template_metadata.location
-        )
-        return self._generate_from_pipeline_template(selected_pipeline_template_dir)
+        with ThreadPoolExecutor(max_workers=1) as executor, osutils.mkdir_temp(ignore_errors=True) as tempdir:
+            # The bootstrapped stages do not depend on the pipeline templates, load them while cloning the templates
+            bootstrap_resources = executor.submit(_load_pipeline_bootstrap_resources)
+            pipeline_templates_local_dir: Path = _clone_app_pipeline_templates(Path(tempdir))
+            pipeline_templates_manifest: PipelineTemplatesManifest = _read_app_pipeline_templates_manifest(
+                pipeline_templates_local_dir
+            )
+            # The manifest contains multiple pipeline-templates so select one
+            selected_pipeline_template_metadata: PipelineTemplateMetadata = _prompt_pipeline_template(
+                pipeline_templates_manifest
+            )
+            selected_pipeline_template_dir: Path = pipeline_templates_local_dir.joinpath(
+                selected_pipeline_template_metadata.location
+            )
+            return self._generate_from_pipeline_template(selected_pipeline_template_dir, bootstrap_resources)
 
     def _generate_from_custom_location(
         self,
@@ -117,8 +146,11 @@ class InteractiveInitFlow:
 
         with osutils.mkdir_temp(ignore_errors=True) as tempdir:
             tempdir_path = Path(tempdir)
-            pipeline_template_local_dir: Path = _clone_pipeline_templates(
-                pipeline_template_git_location, tempdir_path, CUSTOM_PIPELINE_TEMPLATE_REPO_LOCAL_NAME
+            pipeline_template_local_dir: Path = _clone_pipeline_templates_from_mirror(
+                repo_url=pipeline_template_git_location,
+                mirror_name=_get_custom_pipeline_template_mirror_name(pipeline_template_git_location),
+                clone_dir=tempdir_path,
+                clone_name=CUSTOM_PIPELINE_TEMPLATE_REPO_LOCAL_NAME,
             )
             return self._generate_from_pipeline_template(pipeline_template_local_dir)
 
@@ -132,7 +164,7 @@ class InteractiveInitFlow:
             click.echo("[!] None detected in this account.")
         else:
             click.echo(
-                Colored().yellow(
+                self.color.yellow(
                     f"Only {len(stage_configuration_names)} stage(s) were detected, "
                     f"fewer than what the template requires: {number_of_stages}."
                 )
@@ -144,22 +176,9 @@ class InteractiveInitFlow:
                 "Do you want to go through stage setup process now? If you choose no, "
                 "you can still reference other bootstrapped resources."
             ):
-                click.secho(
-                    dedent(
-                        """\
-
-                        For each stage, we will ask for [1] stage definition, [2] account details, and [3]
-                        reference application build resources in order to bootstrap these pipeline
-                        resources.
-
-                        We recommend using an individual AWS account profiles for each stage in your
-                        pipeline. You can set these profiles up using aws configure or ~/.aws/credentials. See
-                        [https://docs.aws.amazon.com/serverless-application-model/latest/developerguide/serverless-getting-started-set-up-credentials.html].
-                        """  # pylint: disable=C0301
-                    )
-                )
+                click.secho(BOOTSTRAP_INTRO_MESSAGE)
 
-                click.echo(Colored().bold(f"\nStage {len(stage_configuration_names) + 1} Setup\n"))
+                click.echo(self.color.bold(f"\nStage {len(stage_configuration_names) + 1} Setup\n"))
                 do_bootstrap(
                     region=None,
                     profile=None,
@@ -178,26 +197,24 @@ class InteractiveInitFlow:
                 )
                 return True
         else:
-            click.echo(
-                dedent(
-                    """\
-                    To set up stage(s), please quit the process using Ctrl+C and use one of the following commands:
-                    sam pipeline init --bootstrap       To be guided through the stage and config file creation process.
-                    sam pipeline bootstrap              To specify details for an individual stage.
-                    """
-                )
-            )
+            click.echo(BOOTSTRAP_HINT_MESSAGE)
             click.prompt(
                 "To reference stage resources bootstrapped in a different account, press enter to proceed", default=""
             )
         return False
 
-    def _generate_from_pipeline_template(self, pipeline_template_dir: Path) -> List[str]:
+    def _generate_from_pipeline_template(
+        self,
+        pipeline_template_dir: Path,
+        preloaded_bootstrap_resources: Optional[Future] = None,
+    ) -> List[str]:
         """
         Generates a pipeline config file from a given pipeline template local location
         and return the list of generated files.
+        If given, preloaded_bootstrap_resources is the pending result of _load_pipeline_bootstrap_resources(),
+        used instead of loading the pipeline bootstrap resources for the first time.
         """
-        pipeline_template: Template = _initialize_pipeline_template(pipeline_template_dir)
+        pipeline_template: "Template" = _initialize_pipeline_template(pipeline_template_dir)
         number_of_stages = (pipeline_template.metadata or {}).get("number_of_stages")
         if not number_of_stages:
             LOG.debug("Cannot find number_of_stages from template's metadata, set to default 2.")
@@ -206,7 +223,11 @@ class InteractiveInitFlow:
         _draw_stage_diagram(number_of_stages)
         while True:
             click.echo("Checking for existing stages...\n")
-            stage_configuration_names, bootstrap_context = _load_pipeline_bootstrap_resources()
+            if preloaded_bootstrap_resources:
+                stage_configuration_names, bootstrap_context = preloaded_bootstrap_resources.result()
+                preloaded_bootstrap_resources = None
+            else:
+                stage_configuration_names, bootstrap_context = _load_pipeline_bootstrap_resources()
             if len(stage_configuration_names) < number_of_stages and self._prompt_run_bootstrap_within_pipeline_init(
                 stage_configuration_names, number_of_stages
             ):
@@ -223,13 +244,13 @@ class InteractiveInitFlow:
             return _copy_dir_contents_to_cwd(generate_dir)
 
 
-def _load_pipeline_bootstrap_resources() -> Tuple[List[str], Dict[str, str]]:
+def _load_pipeline_bootstrap_resources() -> Tuple[List[str], Dict[Tuple[str, ...], str]]:
     section = "parameters"
     context: Dict = {}
 
     config = SamConfig(PIPELINE_CONFIG_DIR, PIPELINE_CONFIG_FILENAME)
     if not config.exists():
-        context[str(["stage_names_message"])] = ""
+        context[("stage_names_message",)] = ""
         return [], context
 
     # config.get_stage_configuration_names() will return the list of
@@ -240,25 +261,24 @@ def _load_pipeline_bootstrap_resources() -> Tuple[List[str], Dict[str, str]]:
         for stage_configuration_name in config.get_stage_configuration_names()
         if stage_configuration_name != "default"
     ]
-    for index, stage in enumerate(stage_configuration_names):
-        for key, value in config.get_all(_get_bootstrap_command_names(), section, stage).items():
-            context[str([stage, key])] = value
-            # create an index alias for each stage name
-            # so that if customers type "1," it is equivalent to the first stage name
-            context[str([str(index + 1), key])] = value
+    # pipelineconfig.toml is parsed once by the SamConfig above, get_all() only looks up the already parsed document
+    bootstrap_command_names = _get_bootstrap_command_names()
+    for index, stage in enumerate(stage_configuration_names, start=1):
+        # create an index alias for each stage name
+        # so that if customers type "1," it is equivalent to the first stage name
+        stage_index = str(index)
+        for key, value in config.get_all(bootstrap_command_names, section, stage).items():
+            context[(stage, key)] = value
+            context[(stage_index, key)] = value
 
     # pre-load the list of stage names detected from pipelineconfig.toml
-    stage_names_message = (
-        "Here are the stage configuration names detected "
-        + f"in {os.path.join(PIPELINE_CONFIG_DIR, PIPELINE_CONFIG_FILENAME)}:\n"
-        + "\n".join(
-            [
-                f"\t{index + 1} - {stage_configuration_name}"
-                for index, stage_configuration_name in enumerate(stage_configuration_names)
-            ]
-        )
+    config_path = os.path.join(PIPELINE_CONFIG_DIR, PIPELINE_CONFIG_FILENAME)
+    stage_names_lines = "\n".join(
+        f"\t{index} - {stage_configuration_name}"
+        for index, stage_configuration_name in enumerate(stage_configuration_names, start=1)
     )
-    context[str(["stage_names_message"])] = stage_names_message
+    stage_names_message = f"Here are the stage configuration names detected in {config_path}:\n{stage_names_lines}"
+    context[("stage_names_message",)] = stage_names_message
 
     return stage_configuration_names, context
 
@@ -269,53 +289,136 @@ def _copy_dir_contents_to_cwd(source_dir: str) -> List[str]:
     If existing files are encountered, ask for confirmation.
     If not confirmed, all files will be written to
     .aws-sam/pipeline/generated-files/
+    The files are moved rather than copied, so source_dir is left empty of files afterwards.
     """
     file_paths: List[str] = []
     existing_file_paths: List[str] = []
-    for root, _, files in os.walk(source_dir):
-        for filename in files:
-            file_path = Path(root, filename)
-            target_file_path = Path(".").joinpath(file_path.relative_to(source_dir))
-            LOG.debug("Verify %s does not exist", target_file_path)
-            if target_file_path.exists():
-                existing_file_paths.append(str(target_file_path))
-            file_paths.append(str(target_file_path))
+    _scan_files(source_dir, "", file_paths, existing_file_paths)
+    target_dir = "."
     if existing_file_paths:
         click.echo("\nThe following files already exist:")
         for existing_file_path in existing_file_paths:
             click.echo(f"\t- {existing_file_path}")
         if not click.confirm("Do you want to override them?"):
             target_dir = str(Path(PIPELINE_CONFIG_DIR, "generated-files"))
-            osutils.copytree(source_dir, target_dir)
+            _move_files(source_dir, target_dir, file_paths)
             click.echo(f"All files are saved to {target_dir}.")
             return [str(Path(target_dir, path)) for path in file_paths]
-    LOG.debug("Copy contents of %s to cwd", source_dir)
-    osutils.copytree(source_dir, ".")
+    LOG.debug("Move contents of %s to cwd", source_dir)
+    _move_files(source_dir, target_dir, file_paths)
     return file_paths
 
 
-def _clone_app_pipeline_templates() -> Path:
+def _scan_files(dir_path: str, relative_dir: str, file_paths: List[str], existing_file_paths: List[str]) -> None:
+    """
+    Recursively collect the paths, relative to the scanned root, of the files under dir_path into file_paths,
+    and the ones that already exist relative to the cwd into existing_file_paths as well.
+    Like os.walk, symlinks to directories are not followed.
+    """
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            file_path = os.path.join(relative_dir, entry.name)
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    _scan_files(entry.path, file_path, file_paths, existing_file_paths)
+                continue
+            LOG.debug("Verify %s does not exist", file_path)
+            if os.path.lexists(file_path):
+                existing_file_paths.append(file_path)
+            file_paths.append(file_path)
+
+
+def _move_files(source_dir: str, target_dir: str, file_paths: List[str]) -> None:
     """
-    clone aws/aws-sam-cli-pipeline-init-templates.git Git repo to the local machine in SAM shared directory.
+    Move the given files, relative to source_dir, to the same relative paths in target_dir
+    overriding any existing file.
+    """
+    for file_path in file_paths:
+        target_file_path = os.path.join(target_dir, file_path)
+        os.makedirs(os.path.dirname(target_file_path) or ".", exist_ok=True)
+        # shutil.move renames the file when possible, and falls back to copy+delete across file systems
+        shutil.move(os.path.join(source_dir, file_path), target_file_path)
+
+
+def _clone_app_pipeline_templates(clone_dir: Path) -> Path:
+    """
+    clone aws/aws-sam-cli-pipeline-init-templates.git Git repo to the local machine inside the given clone_dir,
+    through a mirror of the repo kept in SAM shared directory.
+
+    Parameters:
+        clone_dir: the local parent directory to clone to
+
     Returns:
         the local directory path where the repo is cloned.
     """
+    return _clone_pipeline_templates_from_mirror(
+        repo_url=APP_PIPELINE_TEMPLATES_REPO_URL,
+        mirror_name=APP_PIPELINE_TEMPLATES_REPO_MIRROR_NAME,
+        clone_dir=clone_dir,
+        clone_name=APP_PIPELINE_TEMPLATES_REPO_LOCAL_NAME,
+    )
+
+
+def _get_custom_pipeline_template_mirror_name(repo_url: str) -> str:
+    """
+    Each custom pipeline template repo gets its own mirror in SAM shared directory, named after a hash of its URL
+    """
+    repo_url_hash = hashlib.sha256(repo_url.encode("utf-8")).hexdigest()[0:10]
+    return f"{CUSTOM_PIPELINE_TEMPLATE_REPO_LOCAL_NAME}-{repo_url_hash}.git"
+
+
+def _clone_pipeline_templates_from_mirror(repo_url: str, mirror_name: str, clone_dir: Path, clone_name: str) -> Path:
+    """
+    Create or update a local mirror of a given pipeline templates' Git repo in SAM shared directory, then clone that
+    mirror inside the given clone_dir directory under the given clone name. Only the first run downloads the whole
+    repo, the following runs only fetch what changed since the previous one and the clone itself is done locally.
+
+    Parameters:
+        repo_url: the URL of the Git repo to clone
+        mirror_name: The folder name to give to the mirror inside SAM shared directory
+        clone_dir: the local parent directory to clone to
+        clone_name: The folder name to give to the created clone inside clone_dir
+
+    Returns:
+        Path to the local clone
+    """
+    mirror_path: Path = shared_path.joinpath(mirror_name)
     try:
-        return _clone_pipeline_templates(
-            repo_url=APP_PIPELINE_TEMPLATES_REPO_URL,
-            clone_dir=shared_path,
-            clone_name=APP_PIPELINE_TEMPLATES_REPO_LOCAL_NAME,
-        )
+        _ensure_mirror(repo_url, mirror_path)
     except PipelineTemplateCloneException:
-        # If can't clone app pipeline templates, try using an old clone from a previous run if already exist
-        expected_previous_clone_local_path: Path = shared_path.joinpath(APP_PIPELINE_TEMPLATES_REPO_LOCAL_NAME)
-        if expected_previous_clone_local_path.exists():
-            click.echo("Unable to download updated app pipeline templates, using existing ones")
-            return expected_previous_clone_local_path
-        raise
+        # If can't update the mirror, try using the mirror from a previous run if already exist
+        if not mirror_path.exists():
+            raise
+        click.echo("Unable to download updated pipeline templates, using existing ones")
+    # The mirror keeps the whole history, only the latest snapshot is needed for the clone. git ignores --depth for
+    # clones from a plain local path, so clone from a file:// URL instead.
+    return _clone_pipeline_templates(mirror_path.resolve().as_uri(), clone_dir, clone_name, depth=1, single_branch=True)
 
 
-def _clone_pipeline_templates(repo_url: str, clone_dir: Path, clone_name: str) -> Path:
+def _ensure_mirror(repo_url: str, mirror_path: Path) -> Path:
+    """
+    create a local bare mirror of a given pipeline templates' Git repo at the given mirror_path,
+    or update it if it already exists
+
+    Parameters:
+        repo_url: the URL of the Git repo to mirror
+        mirror_path: the local path of the mirror
+
+    Returns:
+        Path to the local mirror
+    """
+    from samcli.lib.utils.git_repo import GitRepo, CloneRepoException
+
+    try:
+        repo: GitRepo = GitRepo(repo_url)
+        return repo.mirror(mirror_path.parent, mirror_path.name)
+    except (OSError, CloneRepoException) as ex:
+        raise PipelineTemplateCloneException(str(ex)) from ex
+
+
+def _clone_pipeline_templates(
+    repo_url: str, clone_dir: Path, clone_name: str, depth: Optional[int] = None, single_branch: bool = False
+) -> Path:
     """
     clone a given pipeline templates' Git repo to the user machine inside the given clone_dir directory
     under the given clone name. For example, if clone_name is "custom-pipeline-template" then the location to clone
@@ -325,13 +428,19 @@ def _clone_pipeline_templates(repo_url: str, clone_dir: Path, clone_name: str) -
         repo_url: the URL of the Git repo to clone
         clone_dir: the local parent directory to clone to
         clone_name: The folder name to give to the created clone inside clone_dir
+        depth: If set, create a shallow clone with a history truncated to this number of commits
+        single_branch: Whether to clone only the default branch or not
 
     Returns:
         Path to the local clone
     """
+    from samcli.lib.utils.git_repo import GitRepo, CloneRepoException
+
     try:
         repo: GitRepo = GitRepo(repo_url)
-        clone_path: Path = repo.clone(clone_dir, clone_name, replace_existing=True)
+        clone_path: Path = repo.clone(
+            clone_dir, clone_name, replace_existing=True, depth=depth, single_branch=single_branch
+        )
         return clone_path
     except (OSError, CloneRepoException) as ex:
         raise PipelineTemplateCloneException(str(ex)) from ex
@@ -351,7 +460,30 @@ def _read_app_pipeline_templates_manifest(pipeline_templates_dir: Path) -> Pipel
         The manifest of the pipeline templates
     """
     manifest_path: Path = pipeline_templates_dir.joinpath("manifest.yaml")
-    return PipelineTemplatesManifest(manifest_path)
+    try:
+        manifest_checksum = file_checksum(str(manifest_path), hashlib.sha256())
+    except OSError:
+        # let PipelineTemplatesManifest report the missing manifest
+        return PipelineTemplatesManifest(manifest_path)
+
+    # The parsed manifest is cached as JSON in SAM shared directory and reused as long as the manifest is unchanged,
+    # loading JSON is much cheaper than parsing YAML
+    cache_path: Path = shared_path.joinpath(APP_PIPELINE_TEMPLATES_MANIFEST_CACHE_NAME)
+    try:
+        with open(cache_path, "r", encoding="utf-8") as file:
+            cache = json.load(file)
+        if cache["checksum"] == manifest_checksum:
+            return PipelineTemplatesManifest.from_dict(cache["manifest"], manifest_path)
+    except (OSError, ValueError, KeyError, TypeError, AppPipelineTemplateManifestException) as ex:
+        LOG.debug("Unable to load the cached pipeline templates manifest %s", cache_path, exc_info=ex)
+
+    manifest = PipelineTemplatesManifest(manifest_path)
+    try:
+        with open(cache_path, "w", encoding="utf-8") as file:
+            json.dump({"checksum": manifest_checksum, "manifest": manifest.to_dict()}, file)
+    except OSError as ex:
+        LOG.debug("Unable to cache the pipeline templates manifest to %s", cache_path, exc_info=ex)
+    return manifest
 
 
 def _prompt_pipeline_template(pipeline_templates_manifest: PipelineTemplatesManifest) -> PipelineTemplateMetadata:
@@ -366,8 +498,8 @@ def _prompt_pipeline_template(pipeline_templates_manifest: PipelineTemplatesMani
          The manifest (A section in the pipeline_templates_manifest) of the chosen pipeline template;
     """
     provider = _prompt_cicd_provider(pipeline_templates_manifest.providers)
-    provider_pipeline_templates: List[PipelineTemplateMetadata] = [
-        t for t in pipeline_templates_manifest.templates if t.provider == provider.id
+    provider_pipeline_templates: List[PipelineTemplateMetadata] = pipeline_templates_manifest.templates_by_provider[
+        provider.id
     ]
     selected_template_manifest: PipelineTemplateMetadata = _prompt_provider_pipeline_template(
         provider_pipeline_templates
@@ -388,14 +520,15 @@ def _prompt_cicd_provider(available_providers: List[Provider]) -> Provider:
     if len(available_providers) == 1:
         return available_providers[0]
 
+    providers_by_display_name: Dict[str, Provider] = {p.display_name: p for p in available_providers}
     question_to_choose_provider = Choice(
         key="provider",
         text="Select CI/CD system",
-        options=[p.display_name for p in available_providers],
+        options=list(providers_by_display_name),
         is_required=True,
     )
     chosen_provider_display_name = question_to_choose_provider.ask()
-    return next(p for p in available_providers if p.display_name == chosen_provider_display_name)
+    return providers_by_display_name[chosen_provider_display_name]
 
 
 def _prompt_provider_pipeline_template(
@@ -412,20 +545,19 @@ def _prompt_provider_pipeline_template(
     """
     if len(provider_available_pipeline_templates_metadata) == 1:
         return provider_available_pipeline_templates_metadata[0]
+    pipeline_templates_by_display_name: Dict[str, PipelineTemplateMetadata] = {
+        t.display_name: t for t in provider_available_pipeline_templates_metadata
+    }
     question_to_choose_pipeline_template = Choice(
         key="pipeline-template",
         text="Which pipeline template would you like to use?",
-        options=[t.display_name for t in provider_available_pipeline_templates_metadata],
+        options=list(pipeline_templates_by_display_name),
     )
     chosen_pipeline_template_display_name = question_to_choose_pipeline_template.ask()
-    return next(
-        t
-        for t in provider_available_pipeline_templates_metadata
-        if t.display_name == chosen_pipeline_template_display_name
-    )
+    return pipeline_templates_by_display_name[chosen_pipeline_template_display_name]
 
 
-def _initialize_pipeline_template(pipeline_template_dir: Path) -> Template:
+def _initialize_pipeline_template(pipeline_template_dir: Path) -> "Template":
     """
     Initialize a pipeline template from a given pipeline template (cookiecutter template) location
 
@@ -435,6 +567,8 @@ def _initialize_pipeline_template(pipeline_template_dir: Path) -> Template:
     Returns:
         The initialized pipeline's cookiecutter template
     """
+    from samcli.lib.cookiecutter.template import Template
+
     interactive_flow = _get_pipeline_template_interactive_flow(pipeline_template_dir)
     metadata = _get_pipeline_template_metadata(pipeline_template_dir)
     return Template(location=str(pipeline_template_dir), interactive_flows=[interactive_flow], metadata=metadata)
@@ -474,22 +608,19 @@ def _get_pipeline_template_interactive_flow(pipeline_template_dir: Path) -> Inte
     Returns:
          The interactive flow
     """
+    from samcli.lib.cookiecutter.interactive_flow_creator import InteractiveFlowCreator
+
     flow_definition_path: Path = pipeline_template_dir.joinpath("questions.json")
     return InteractiveFlowCreator.create_flow(str(flow_definition_path))
 
 
-def _lines_for_stage(stage_index: int) -> List[str]:
-    return [
-        " _________ ",
-        "|         |",
-        f"| Stage {stage_index} |",
-        "|_________|",
-    ]
-
-
 def _draw_stage_diagram(number_of_stages: int) -> None:
     delimiters = ["  ", "  ", "->", "  "]
-    stage_lines = [_lines_for_stage(i + 1) for i in range(number_of_stages)]
-    for i, delimiter in enumerate(delimiters):
-        click.echo(delimiter.join([stage_lines[stage_i][i] for stage_i in range(number_of_stages)]))
+    stage_lines = [
+        (" _________ ", "|         |", f"| Stage {stage_index} |", "|_________|")
+        for stage_index in range(1, number_of_stages + 1)
+    ]
+    # zip(*stage_lines) transposes the per-stage boxes into the rows of the diagram
+    for delimiter, row in zip(delimiters, zip(*stage_lines)):
+        click.echo(delimiter.join(row))
     click.echo("")
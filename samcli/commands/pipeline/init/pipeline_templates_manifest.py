@@ -19,13 +19,22 @@ Example:
         provider: Github Actions
         location: templates/cookiecutter-github-actions-two-environments-pipeline
 """
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List
+from typing import cast, DefaultDict, Dict, List, Optional
 
 import yaml
 
 from samcli.commands.exceptions import AppPipelineTemplateManifestException
-from samcli.yamlhelper import parse_yaml_file
+
+# libyaml (C) based loader is several times faster than the pure python one,
+# it is not available if PyYAML was built without libyaml
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parse_manifest_file(manifest_path: Path) -> Dict:
+    with open(manifest_path, "r", encoding="utf-8") as fp:
+        return cast(Dict, yaml.load(fp, Loader=SafeLoader))
 
 
 class Provider:
@@ -35,6 +44,9 @@ class Provider:
         self.id: str = manifest["id"]
         self.display_name: str = manifest["displayName"]
 
+    def to_dict(self) -> Dict:
+        return {"id": self.id, "displayName": self.display_name}
+
 
 class PipelineTemplateMetadata:
     """The metadata of a Given pipeline template"""
@@ -44,18 +56,37 @@ class PipelineTemplateMetadata:
         self.provider: str = manifest["provider"]
         self.location: str = manifest["location"]
 
+    def to_dict(self) -> Dict:
+        return {"displayName": self.display_name, "provider": self.provider, "location": self.location}
+
 
 class PipelineTemplatesManifest:
     """The metadata of the available CI/CD systems and the pipeline templates"""
 
-    def __init__(self, manifest_path: Path) -> None:
+    def __init__(self, manifest_path: Path, manifest: Optional[Dict] = None) -> None:
         try:
-            manifest: Dict = parse_yaml_file(file_path=str(manifest_path))
+            if manifest is None:
+                manifest = _parse_manifest_file(manifest_path)
             self.providers: List[Provider] = list(map(Provider, manifest["providers"]))
             self.templates: List[PipelineTemplateMetadata] = list(map(PipelineTemplateMetadata, manifest["templates"]))
+            # index the templates by provider id once, rather than scanning them for each chosen provider
+            self.templates_by_provider: DefaultDict[str, List[PipelineTemplateMetadata]] = defaultdict(list)
+            for template in self.templates:
+                self.templates_by_provider[template.provider].append(template)
         except (FileNotFoundError, KeyError, TypeError, yaml.YAMLError) as ex:
             raise AppPipelineTemplateManifestException(
                 "SAM pipeline templates manifest file is not found or ill-formatted. This could happen if the file "
                 f"{manifest_path} got deleted or modified."
                 "If you believe this is not the case, please file an issue at https://github.com/aws/aws-sam-cli/issues"
             ) from ex
+
+    @classmethod
+    def from_dict(cls, manifest: Dict, manifest_path: Path) -> "PipelineTemplatesManifest":
+        """Create the manifest from its already parsed content, for example the output of to_dict()"""
+        return cls(manifest_path, manifest)
+
+    def to_dict(self) -> Dict:
+        return {
+            "providers": [provider.to_dict() for provider in self.providers],
+            "templates": [template.to_dict() for template in self.templates],
+        }
@@ -57,7 +57,7 @@ class InteractiveFlow:
         ----------
         context: Dict
             The cookiecutter context before prompting this flow's questions
-            The context can be used to provide default values, and support both str keys and List[str] keys.
+            The context can be used to provide default values, and support both str keys and Tuple[str, ...] keys.
 
         Returns
         -------
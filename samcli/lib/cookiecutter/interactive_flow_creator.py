@@ -1,8 +1,9 @@
 """ This module parses a json/yaml file that defines a flow of questions to fulfill the cookiecutter context"""
-from typing import Dict, Optional, Tuple
+import json
+from typing import cast, Dict, Optional, Tuple
 import yaml
 from samcli.commands.exceptions import UserException
-from samcli.yamlhelper import parse_yaml_file
+from samcli.yamlhelper import yaml_parse
 from .interactive_flow import InteractiveFlow
 from .question import Question, QuestionFactory
 
@@ -54,7 +55,7 @@ class InteractiveFlowCreator:
                         ]
                       }
                       # assuming the answer of "key-of-another-question" is "ABC"
-                      # the default value will be load from cookiecutter context with key "['ABC', 'pipeline_user]"
+                      # the default value will be load from cookiecutter context with key ("ABC", "pipeline_user")
                     },
                     ...
                 ]
@@ -112,7 +113,16 @@ class InteractiveFlowCreator:
         """
 
         try:
-            return parse_yaml_file(file_path=file_path, extra_context=extra_context)
+            with open(file_path, "r", encoding="utf-8") as fp:
+                content = fp.read()
+            if isinstance(extra_context, dict):
+                content = content % extra_context
+            try:
+                # questions definitions are mostly JSON, decode them straight into plain dicts rather than
+                # going through yaml_parse's OrderedDict based decoding
+                return cast(Dict, json.loads(content))
+            except ValueError:
+                return yaml_parse(content)
         except FileNotFoundError as ex:
             raise QuestionsNotFoundException(f"questions definition file not found at {file_path}") from ex
         except (KeyError, ValueError, yaml.YAMLError) as ex:
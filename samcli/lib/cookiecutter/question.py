@@ -209,7 +209,7 @@ class Question(Promptable):
             if not isinstance(unresolved_key_path, list):
                 raise ValueError(f'Invalid expression "{expression}" in question {self.key}')
 
-            return context.get(str(self._resolve_key_path(unresolved_key_path, context)))
+            return context.get(tuple(self._resolve_key_path(unresolved_key_path, context)))
         return expression
 
     def _resolve_text(self, context: Optional[Dict] = None) -> str:
@@ -32,7 +32,7 @@ class CloneRepoUnstableStateException(CloneRepoException):
 
 class GitRepo:
     """
-    Class for managing a Git repo, currently it has a clone functionality only
+    Class for managing a Git repo, currently it has clone and mirror functionalities only
 
     Attributes
     ----------
@@ -47,8 +47,10 @@ class GitRepo:
 
     Methods
     -------
-    clone(self, clone_dir: Path, clone_name, replace_existing=False) -> Path:
+    clone(self, clone_dir: Path, clone_name, replace_existing=False, depth=None, single_branch=False) -> Path:
         creates a local clone of this Git repository. (more details in the method documentation).
+    mirror(self, mirror_dir: Path, mirror_name: str) -> Path:
+        creates or updates a local bare mirror of this Git repository. (more details in the method documentation).
     """
 
     def __init__(self, url: str) -> None:
@@ -81,7 +83,14 @@ class GitRepo:
 
         raise OSError("Cannot find git, was looking at executables: {}".format(executables))
 
-    def clone(self, clone_dir: Path, clone_name: str, replace_existing: bool = False) -> Path:
+    def clone(
+        self,
+        clone_dir: Path,
+        clone_name: str,
+        replace_existing: bool = False,
+        depth: Optional[int] = None,
+        single_branch: bool = False,
+    ) -> Path:
         """
         creates a local clone of this Git repository.
         This method is different from the standard Git clone in the following:
@@ -98,6 +107,10 @@ class GitRepo:
             The dirname of the local clone
         replace_existing: bool
             Whether to replace the current local clone directory if already exists or not
+        depth: Optional[int]
+            If set, create a shallow clone with a history truncated to this number of commits
+        single_branch: bool
+            Whether to clone only the history leading to the tip of the default branch or not
 
         Returns
         -------
@@ -121,9 +134,14 @@ class GitRepo:
             try:
                 temp_path = os.path.normpath(os.path.join(tempdir, clone_name))
                 git_executable: str = GitRepo._git_executable()
+                clone_options = []
+                if depth is not None:
+                    clone_options += ["--depth", str(depth)]
+                if single_branch:
+                    clone_options.append("--single-branch")
                 LOG.info("\nCloning from %s", self.url)
                 check_output(
-                    [git_executable, "clone", self.url, clone_name],
+                    [git_executable, "clone", *clone_options, self.url, clone_name],
                     cwd=tempdir,
                     stderr=subprocess.STDOUT,
                 )
@@ -140,6 +158,65 @@ class GitRepo:
             finally:
                 self.clone_attempted = True
 
+    def mirror(self, mirror_dir: Path, mirror_name: str) -> Path:
+        """
+        creates a local bare mirror of this Git repository, or brings it up to date if it already exists.
+        A mirror keeps the full history and all the refs of the remote repository, so that later runs only need to
+        fetch the new objects instead of cloning the whole repository again. The mirror can then be used as the
+        (local) url of another GitRepo to create cheap working clones out of it.
+
+        Parameters
+        ----------
+        mirror_dir: Path
+            The directory to create the local mirror inside
+        mirror_name: str
+            The dirname of the local mirror, by convention it ends with ".git"
+
+        Returns
+        -------
+            The path of the local mirror
+
+        Raises
+        ------
+        OSError:
+            when file management errors like unable to mkdir, move ...etc
+        CloneRepoException:
+            if an error occurred while running `git clone --mirror` or `git remote update`
+        """
+        mirror_path = Path(os.path.normpath(mirror_dir.joinpath(mirror_name)))
+        try:
+            git_executable: str = GitRepo._git_executable()
+            if mirror_path.exists():
+                LOG.info("\nUpdating from %s", self.url)
+                check_output(
+                    [git_executable, "remote", "update", "--prune"],
+                    cwd=str(mirror_path),
+                    stderr=subprocess.STDOUT,
+                )
+            else:
+                GitRepo._ensure_clone_directory_exists(clone_dir=mirror_dir)
+                # mirror to temp then move to the destination, so an interrupted mirroring is never left behind
+                with osutils.mkdir_temp(ignore_errors=True) as tempdir:
+                    LOG.info("\nCloning from %s", self.url)
+                    check_output(
+                        [git_executable, "clone", "--mirror", self.url, mirror_name],
+                        cwd=tempdir,
+                        stderr=subprocess.STDOUT,
+                    )
+                    shutil.move(os.path.join(tempdir, mirror_name), str(mirror_path))
+            self.local_path = mirror_path
+            return self.local_path
+        except OSError as ex:
+            LOG.warning("WARN: Could not mirror repo %s", self.url, exc_info=ex)
+            raise
+        except subprocess.CalledProcessError as mirror_error:
+            output = mirror_error.output.decode("utf-8")
+            if "not found" in output.lower():
+                LOG.warning("WARN: Could not mirror repo %s", self.url, exc_info=mirror_error)
+            raise CloneRepoException(output) from mirror_error
+        finally:
+            self.clone_attempted = True
+
     @staticmethod
     def _persist_local_repo(temp_path: str, dest_dir: Path, dest_name: str, replace_existing: bool) -> Path:
         dest_path = os.path.normpath(dest_dir.joinpath(dest_name))
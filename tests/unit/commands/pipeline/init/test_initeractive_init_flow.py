@@ -2,7 +2,7 @@ import json
 import shutil
 import tempfile
 from unittest import TestCase
-from unittest.mock import patch, Mock, call
+from unittest.mock import patch, Mock, ANY, call
 import os
 from pathlib import Path
 
@@ -13,12 +13,17 @@ from samcli.commands.pipeline.init.interactive_init_flow import (
     InteractiveInitFlow,
     PipelineTemplateCloneException,
     APP_PIPELINE_TEMPLATES_REPO_LOCAL_NAME,
+    APP_PIPELINE_TEMPLATES_REPO_MIRROR_NAME,
     shared_path,
     CUSTOM_PIPELINE_TEMPLATE_REPO_LOCAL_NAME,
     _prompt_cicd_provider,
     _prompt_provider_pipeline_template,
     _get_pipeline_template_metadata,
     _copy_dir_contents_to_cwd,
+    _read_app_pipeline_templates_manifest,
+    _load_pipeline_bootstrap_resources,
+    _draw_stage_diagram,
+    APP_PIPELINE_TEMPLATES_MANIFEST_CACHE_NAME,
 )
 from samcli.commands.pipeline.init.pipeline_templates_manifest import AppPipelineTemplateManifestException
 from samcli.lib.utils.git_repo import CloneRepoException
@@ -30,11 +35,13 @@ class TestInteractiveInitFlow(TestCase):
     @patch("samcli.commands.pipeline.init.interactive_init_flow._prompt_pipeline_template")
     @patch("samcli.commands.pipeline.init.interactive_init_flow.InteractiveInitFlow._generate_from_pipeline_template")
     @patch("samcli.commands.pipeline.init.interactive_init_flow.shared_path")
-    @patch("samcli.commands.pipeline.init.interactive_init_flow.GitRepo.clone")
+    @patch("samcli.lib.utils.git_repo.GitRepo.clone")
+    @patch("samcli.lib.utils.git_repo.GitRepo.mirror")
     @patch("samcli.lib.cookiecutter.question.click")
-    def test_app_pipeline_templates_clone_fail_when_an_old_clone_exists(
+    def test_app_pipeline_templates_mirror_update_fail_when_an_old_mirror_exists(
         self,
         click_mock,
+        mirror_mock,
         clone_mock,
         shared_path_mock,
         generate_from_pipeline_template_mock,
@@ -42,12 +49,14 @@ class TestInteractiveInitFlow(TestCase):
         read_app_pipeline_templates_manifest_mock,
     ):
         # setup
-        clone_mock.side_effect = CloneRepoException  # clone fail
+        mirror_mock.side_effect = CloneRepoException  # mirror update fail
+        app_pipeline_templates_mirror_path_mock = Mock()
         app_pipeline_templates_path_mock = Mock()
         selected_pipeline_template_path_mock = Mock()
         pipeline_templates_manifest_mock = Mock()
-        shared_path_mock.joinpath.return_value = app_pipeline_templates_path_mock
-        app_pipeline_templates_path_mock.exists.return_value = True  # An old clone exists
+        shared_path_mock.joinpath.return_value = app_pipeline_templates_mirror_path_mock
+        app_pipeline_templates_mirror_path_mock.exists.return_value = True  # An old mirror exists
+        clone_mock.return_value = app_pipeline_templates_path_mock
         app_pipeline_templates_path_mock.joinpath.return_value = selected_pipeline_template_path_mock
         read_app_pipeline_templates_manifest_mock.return_value = pipeline_templates_manifest_mock
         click_mock.prompt.return_value = "1"  # App pipeline templates
@@ -56,35 +65,47 @@ class TestInteractiveInitFlow(TestCase):
         InteractiveInitFlow(allow_bootstrap=False).do_interactive()
 
         # verify
+        shared_path_mock.joinpath.assert_called_once_with(APP_PIPELINE_TEMPLATES_REPO_MIRROR_NAME)
+        mirror_mock.assert_called_once_with(
+            app_pipeline_templates_mirror_path_mock.parent, app_pipeline_templates_mirror_path_mock.name
+        )
+        app_pipeline_templates_mirror_path_mock.exists.assert_called_once()
         clone_mock.assert_called_once_with(
-            shared_path_mock, APP_PIPELINE_TEMPLATES_REPO_LOCAL_NAME, replace_existing=True
+            ANY, APP_PIPELINE_TEMPLATES_REPO_LOCAL_NAME, replace_existing=True, depth=1, single_branch=True
         )
-        app_pipeline_templates_path_mock.exists.assert_called_once()
         read_app_pipeline_templates_manifest_mock.assert_called_once_with(app_pipeline_templates_path_mock)
         select_pipeline_template_mock.assert_called_once_with(pipeline_templates_manifest_mock)
-        generate_from_pipeline_template_mock.assert_called_once_with(selected_pipeline_template_path_mock)
+        generate_from_pipeline_template_mock.assert_called_once_with(selected_pipeline_template_path_mock, ANY)
 
     @patch("samcli.commands.pipeline.init.interactive_init_flow.shared_path")
-    @patch("samcli.commands.pipeline.init.interactive_init_flow.GitRepo.clone")
+    @patch("samcli.lib.utils.git_repo.GitRepo.clone")
+    @patch("samcli.lib.utils.git_repo.GitRepo.mirror")
     @patch("samcli.lib.cookiecutter.question.click")
-    def test_app_pipeline_templates_clone_fail_when_no_old_clone_exist(self, click_mock, clone_mock, shared_path_mock):
+    def test_app_pipeline_templates_mirror_fail_when_no_old_mirror_exist(
+        self, click_mock, mirror_mock, clone_mock, shared_path_mock
+    ):
         # setup
-        clone_mock.side_effect = CloneRepoException  # clone fail
-        app_pipeline_templates_path_mock = Mock()
-        shared_path_mock.joinpath.return_value = app_pipeline_templates_path_mock
-        app_pipeline_templates_path_mock.exists.return_value = False  # No old clone exists
+        mirror_mock.side_effect = CloneRepoException  # mirror fail
+        app_pipeline_templates_mirror_path_mock = Mock()
+        shared_path_mock.joinpath.return_value = app_pipeline_templates_mirror_path_mock
+        app_pipeline_templates_mirror_path_mock.exists.return_value = False  # No old mirror exists
         click_mock.prompt.return_value = "1"  # App pipeline templates
 
         # trigger
         with self.assertRaises(PipelineTemplateCloneException):
             InteractiveInitFlow(allow_bootstrap=False).do_interactive()
+        clone_mock.assert_not_called()
 
-    @patch("samcli.commands.pipeline.init.interactive_init_flow.GitRepo.clone")
+    @patch("samcli.commands.pipeline.init.interactive_init_flow.shared_path")
+    @patch("samcli.lib.utils.git_repo.GitRepo.mirror")
     @patch("samcli.commands.pipeline.init.interactive_init_flow.click")
     @patch("samcli.lib.cookiecutter.question.click")
-    def test_custom_pipeline_template_clone_fail(self, question_click_mock, init_click_mock, clone_mock):
+    def test_custom_pipeline_template_clone_fail(
+        self, question_click_mock, init_click_mock, mirror_mock, shared_path_mock
+    ):
         # setup
-        clone_mock.side_effect = CloneRepoException  # clone fail
+        mirror_mock.side_effect = CloneRepoException  # clone fail
+        shared_path_mock.joinpath.return_value.exists.return_value = False  # No old mirror exists
         question_click_mock.prompt.return_value = "2"  # Custom pipeline templates
         init_click_mock.prompt.return_value = (
             "https://github.com/any-custom-pipeline-template-repo.git"  # Custom pipeline template repo URL
@@ -95,10 +116,11 @@ class TestInteractiveInitFlow(TestCase):
             InteractiveInitFlow(allow_bootstrap=False).do_interactive()
 
     @patch("samcli.commands.pipeline.init.interactive_init_flow._read_app_pipeline_templates_manifest")
-    @patch("samcli.commands.pipeline.init.interactive_init_flow.GitRepo.clone")
+    @patch("samcli.lib.utils.git_repo.GitRepo.mirror")
+    @patch("samcli.lib.utils.git_repo.GitRepo.clone")
     @patch("samcli.lib.cookiecutter.question.click")
     def test_app_pipeline_templates_with_invalid_manifest(
-        self, click_mock, clone_mock, read_app_pipeline_templates_manifest_mock
+        self, click_mock, clone_mock, mirror_mock, read_app_pipeline_templates_manifest_mock
     ):
         # setup
         app_pipeline_templates_path_mock = Mock()
@@ -113,9 +135,10 @@ class TestInteractiveInitFlow(TestCase):
     @patch("samcli.commands.pipeline.init.interactive_init_flow.SamConfig")
     @patch("samcli.commands.pipeline.init.interactive_init_flow.osutils")
     @patch("samcli.lib.cookiecutter.template.cookiecutter")
-    @patch("samcli.commands.pipeline.init.interactive_init_flow.InteractiveFlowCreator.create_flow")
+    @patch("samcli.lib.cookiecutter.interactive_flow_creator.InteractiveFlowCreator.create_flow")
     @patch("samcli.commands.pipeline.init.interactive_init_flow.PipelineTemplatesManifest")
-    @patch("samcli.commands.pipeline.init.interactive_init_flow.GitRepo.clone")
+    @patch("samcli.lib.utils.git_repo.GitRepo.mirror")
+    @patch("samcli.lib.utils.git_repo.GitRepo.clone")
     @patch("samcli.commands.pipeline.init.interactive_init_flow._copy_dir_contents_to_cwd")
     @patch("samcli.commands.pipeline.init.interactive_init_flow._get_pipeline_template_metadata")
     @patch("samcli.lib.cookiecutter.question.click")
@@ -125,6 +148,7 @@ class TestInteractiveInitFlow(TestCase):
         _get_pipeline_template_metadata_mock,
         _copy_dir_contents_to_cwd_mock,
         clone_mock,
+        mirror_mock,
         PipelineTemplatesManifest_mock,
         create_interactive_flow_mock,
         cookiecutter_mock,
@@ -132,9 +156,8 @@ class TestInteractiveInitFlow(TestCase):
         samconfig_mock,
     ):
         # setup
-        any_app_pipeline_templates_path = Path(
-            os.path.normpath(shared_path.joinpath(APP_PIPELINE_TEMPLATES_REPO_LOCAL_NAME))
-        )
+        any_temp_dir = "/tmp/any/dir"
+        any_app_pipeline_templates_path = Path(os.path.join(any_temp_dir, APP_PIPELINE_TEMPLATES_REPO_LOCAL_NAME))
         clone_mock.return_value = any_app_pipeline_templates_path
         jenkins_template_location = "some/location"
         jenkins_template_mock = Mock(
@@ -146,10 +169,12 @@ class TestInteractiveInitFlow(TestCase):
                 Mock(id="jenkins", display_name="Jenkins"),
             ],
             templates=[jenkins_template_mock],
+            templates_by_provider={"jenkins": [jenkins_template_mock]},
         )
         PipelineTemplatesManifest_mock.return_value = pipeline_templates_manifest_mock
         cookiecutter_output_dir_mock = "/tmp/any/dir2"
-        osutils_mock.mkdir_temp.return_value.__enter__ = Mock(return_value=cookiecutter_output_dir_mock)
+        osutils_mock.mkdir_temp.return_value.__enter__ = Mock(side_effect=[any_temp_dir, cookiecutter_output_dir_mock])
+        osutils_mock.mkdir_temp.return_value.__exit__ = Mock()
         interactive_flow_mock = Mock()
         create_interactive_flow_mock.return_value = interactive_flow_mock
         cookiecutter_context_mock = {"key": "value"}
@@ -172,20 +197,28 @@ class TestInteractiveInitFlow(TestCase):
         InteractiveInitFlow(allow_bootstrap=False).do_interactive()
 
         # verify
-        osutils_mock.mkdir_temp.assert_called()  # cookiecutter project is generated to temp
+        # App templates are mirrored to shared path then cloned to temp; cookiecutter project is generated to temp
+        osutils_mock.mkdir_temp.assert_called()
         expected_cookicutter_template_location = any_app_pipeline_templates_path.joinpath(jenkins_template_location)
-        clone_mock.assert_called_once_with(shared_path, APP_PIPELINE_TEMPLATES_REPO_LOCAL_NAME, replace_existing=True)
+        mirror_mock.assert_called_once_with(shared_path, APP_PIPELINE_TEMPLATES_REPO_MIRROR_NAME)
+        clone_mock.assert_called_once_with(
+            Path(any_temp_dir),
+            APP_PIPELINE_TEMPLATES_REPO_LOCAL_NAME,
+            replace_existing=True,
+            depth=1,
+            single_branch=True,
+        )
         PipelineTemplatesManifest_mock.assert_called_once()
         create_interactive_flow_mock.assert_called_once_with(
             str(expected_cookicutter_template_location.joinpath("questions.json"))
         )
         interactive_flow_mock.run.assert_called_once_with(
             {
-                str(["testing", "pipeline_execution_role"]): "arn:aws:iam::123456789012:role/execution-role",
-                str(["1", "pipeline_execution_role"]): "arn:aws:iam::123456789012:role/execution-role",
-                str(["prod", "pipeline_execution_role"]): "arn:aws:iam::123456789012:role/execution-role",
-                str(["2", "pipeline_execution_role"]): "arn:aws:iam::123456789012:role/execution-role",
-                str(["stage_names_message"]): "Here are the stage configuration names detected "
+                ("testing", "pipeline_execution_role"): "arn:aws:iam::123456789012:role/execution-role",
+                ("1", "pipeline_execution_role"): "arn:aws:iam::123456789012:role/execution-role",
+                ("prod", "pipeline_execution_role"): "arn:aws:iam::123456789012:role/execution-role",
+                ("2", "pipeline_execution_role"): "arn:aws:iam::123456789012:role/execution-role",
+                ("stage_names_message",): "Here are the stage configuration names detected "
                 f'in {os.path.join(".aws-sam", "pipeline", "pipelineconfig.toml")}:\n\t1 - testing\n\t2 - prod',
             }
         )
@@ -198,10 +231,11 @@ class TestInteractiveInitFlow(TestCase):
         )
 
     @patch("samcli.commands.pipeline.init.interactive_init_flow._read_app_pipeline_templates_manifest")
-    @patch("samcli.commands.pipeline.init.interactive_init_flow.GitRepo.clone")
+    @patch("samcli.lib.utils.git_repo.GitRepo.mirror")
+    @patch("samcli.lib.utils.git_repo.GitRepo.clone")
     @patch("samcli.lib.cookiecutter.question.click")
     def test_generate_pipeline_configuration_file_when_pipeline_template_missing_questions_file(
-        self, click_mock, clone_mock, read_app_pipeline_templates_manifest_mock
+        self, click_mock, clone_mock, mirror_mock, read_app_pipeline_templates_manifest_mock
     ):
         # setup
         any_app_pipeline_templates_path = shared_path.joinpath(APP_PIPELINE_TEMPLATES_REPO_LOCAL_NAME)
@@ -216,6 +250,7 @@ class TestInteractiveInitFlow(TestCase):
                 Mock(id="jenkins", display_name="Jenkins"),
             ],
             templates=[jenkins_template_mock],
+            templates_by_provider={"jenkins": [jenkins_template_mock]},
         )
         read_app_pipeline_templates_manifest_mock.return_value = pipeline_templates_manifest_mock
 
@@ -232,7 +267,7 @@ class TestInteractiveInitFlow(TestCase):
     @patch("samcli.commands.pipeline.init.interactive_init_flow.os")
     @patch("samcli.commands.pipeline.init.interactive_init_flow.osutils")
     @patch("samcli.commands.pipeline.init.interactive_init_flow.InteractiveInitFlow._generate_from_pipeline_template")
-    @patch("samcli.commands.pipeline.init.interactive_init_flow.GitRepo.clone")
+    @patch("samcli.lib.utils.git_repo.GitRepo.clone")
     @patch("samcli.commands.pipeline.init.interactive_init_flow.click")
     @patch("samcli.lib.cookiecutter.question.click")
     def test_generate_pipeline_configuration_file_from_custom_local_existing_path_will_not_do_git_clone(
@@ -259,8 +294,9 @@ class TestInteractiveInitFlow(TestCase):
 
     @patch("samcli.commands.pipeline.init.interactive_init_flow.osutils")
     @patch("samcli.lib.cookiecutter.template.cookiecutter")
-    @patch("samcli.commands.pipeline.init.interactive_init_flow.InteractiveFlowCreator.create_flow")
-    @patch("samcli.commands.pipeline.init.interactive_init_flow.GitRepo.clone")
+    @patch("samcli.lib.cookiecutter.interactive_flow_creator.InteractiveFlowCreator.create_flow")
+    @patch("samcli.lib.utils.git_repo.GitRepo.mirror")
+    @patch("samcli.lib.utils.git_repo.GitRepo.clone")
     @patch("samcli.commands.pipeline.init.interactive_init_flow.click")
     @patch("samcli.commands.pipeline.init.interactive_init_flow._copy_dir_contents_to_cwd")
     @patch("samcli.commands.pipeline.init.interactive_init_flow._get_pipeline_template_metadata")
@@ -272,6 +308,7 @@ class TestInteractiveInitFlow(TestCase):
         _copy_dir_contents_to_cwd_mock,
         init_click_mock,
         clone_mock,
+        mirror_mock,
         create_interactive_flow_mock,
         cookiecutter_mock,
         osutils_mock,
@@ -299,8 +336,13 @@ class TestInteractiveInitFlow(TestCase):
         # verify
         # Custom templates are cloned to temp; cookiecutter project is generated to temp
         osutils_mock.mkdir_temp.assert_called()
+        mirror_mock.assert_called_once_with(shared_path, ANY)
         clone_mock.assert_called_once_with(
-            Path(any_temp_dir), CUSTOM_PIPELINE_TEMPLATE_REPO_LOCAL_NAME, replace_existing=True
+            Path(any_temp_dir),
+            CUSTOM_PIPELINE_TEMPLATE_REPO_LOCAL_NAME,
+            replace_existing=True,
+            depth=1,
+            single_branch=True,
         )
         create_interactive_flow_mock.assert_called_once_with(
             str(any_custom_pipeline_templates_path.joinpath("questions.json"))
@@ -374,16 +416,88 @@ class TestInteractiveInitFlow(TestCase):
                 _get_pipeline_template_metadata(dir)
 
 
+class TestInteractiveInitFlow_read_app_pipeline_templates_manifest(TestCase):
+    MANIFEST = "providers:\n  - displayName: Jenkins\n    id: jenkins\ntemplates: []\n"
+
+    @patch("samcli.commands.pipeline.init.interactive_init_flow.shared_path")
+    def test_manifest_is_cached_after_parsing(self, shared_path_mock):
+        with tempfile.TemporaryDirectory() as templates_dir, tempfile.TemporaryDirectory() as shared_dir:
+            shared_path_mock.joinpath.side_effect = Path(shared_dir).joinpath
+            Path(templates_dir, "manifest.yaml").write_text(self.MANIFEST)
+
+            manifest = _read_app_pipeline_templates_manifest(Path(templates_dir))
+
+            self.assertEqual(manifest.providers[0].id, "jenkins")
+            cache = json.loads(Path(shared_dir, APP_PIPELINE_TEMPLATES_MANIFEST_CACHE_NAME).read_text())
+            self.assertEqual(cache["manifest"], manifest.to_dict())
+
+    @patch("samcli.commands.pipeline.init.pipeline_templates_manifest._parse_manifest_file")
+    @patch("samcli.commands.pipeline.init.interactive_init_flow.shared_path")
+    def test_cached_manifest_is_used_if_manifest_unchanged(self, shared_path_mock, parse_manifest_file_mock):
+        with tempfile.TemporaryDirectory() as templates_dir, tempfile.TemporaryDirectory() as shared_dir:
+            shared_path_mock.joinpath.side_effect = Path(shared_dir).joinpath
+            Path(templates_dir, "manifest.yaml").write_text(self.MANIFEST)
+            parse_manifest_file_mock.return_value = {
+                "providers": [{"displayName": "Jenkins", "id": "jenkins"}],
+                "templates": [],
+            }
+
+            _read_app_pipeline_templates_manifest(Path(templates_dir))
+            manifest = _read_app_pipeline_templates_manifest(Path(templates_dir))
+            parse_manifest_file_mock.assert_called_once()
+            self.assertEqual(manifest.providers[0].id, "jenkins")
+
+            # a changed manifest is parsed again
+            Path(templates_dir, "manifest.yaml").write_text(self.MANIFEST + "\n")
+            _read_app_pipeline_templates_manifest(Path(templates_dir))
+            self.assertEqual(parse_manifest_file_mock.call_count, 2)
+
+
+class TestInteractiveInitFlow_load_pipeline_bootstrap_resources(TestCase):
+    @patch("samcli.commands.pipeline.init.interactive_init_flow.SamConfig")
+    def test_config_is_loaded_once_for_all_stages(self, samconfig_mock):
+        config_file = Mock()
+        samconfig_mock.return_value = config_file
+        config_file.exists.return_value = True
+        config_file.get_stage_configuration_names.return_value = ["default", "testing", "prod"]
+        config_file.get_all.side_effect = [{"region": "us-east-1"}, {"region": "us-west-2"}]
+
+        stage_configuration_names, context = _load_pipeline_bootstrap_resources()
+
+        samconfig_mock.assert_called_once()
+        config_file.get_all.assert_has_calls(
+            [
+                call(["pipeline", "bootstrap"], "parameters", "testing"),
+                call(["pipeline", "bootstrap"], "parameters", "prod"),
+            ]
+        )
+        self.assertEqual(stage_configuration_names, ["testing", "prod"])
+        self.assertEqual(context[("testing", "region")], "us-east-1")
+        self.assertEqual(context[("1", "region")], "us-east-1")
+        self.assertEqual(context[("prod", "region")], "us-west-2")
+        self.assertEqual(context[("2", "region")], "us-west-2")
+
+    @patch("samcli.commands.pipeline.init.interactive_init_flow.SamConfig")
+    def test_no_config(self, samconfig_mock):
+        samconfig_mock.return_value.exists.return_value = False
+
+        stage_configuration_names, context = _load_pipeline_bootstrap_resources()
+
+        self.assertEqual(stage_configuration_names, [])
+        self.assertEqual(context, {("stage_names_message",): ""})
+
+
 class TestInteractiveInitFlowWithBootstrap(TestCase):
     @patch("samcli.commands.pipeline.init.interactive_init_flow.SamConfig")
     @patch("samcli.commands.pipeline.init.interactive_init_flow.osutils")
     @patch("samcli.lib.cookiecutter.template.cookiecutter")
-    @patch("samcli.commands.pipeline.init.interactive_init_flow.InteractiveFlowCreator.create_flow")
+    @patch("samcli.lib.cookiecutter.interactive_flow_creator.InteractiveFlowCreator.create_flow")
     @patch(
         "samcli.commands.pipeline.init.interactive_init_flow.InteractiveInitFlow._prompt_run_bootstrap_within_pipeline_init"
     )
     @patch("samcli.commands.pipeline.init.interactive_init_flow.PipelineTemplatesManifest")
-    @patch("samcli.commands.pipeline.init.interactive_init_flow.GitRepo.clone")
+    @patch("samcli.lib.utils.git_repo.GitRepo.mirror")
+    @patch("samcli.lib.utils.git_repo.GitRepo.clone")
     @patch("samcli.commands.pipeline.init.interactive_init_flow._copy_dir_contents_to_cwd")
     @patch("samcli.commands.pipeline.init.interactive_init_flow._get_pipeline_template_metadata")
     @patch("samcli.lib.cookiecutter.question.click")
@@ -393,6 +507,7 @@ class TestInteractiveInitFlowWithBootstrap(TestCase):
         _get_pipeline_template_metadata_mock,
         _copy_dir_contents_to_cwd_mock,
         clone_mock,
+        mirror_mock,
         PipelineTemplatesManifest_mock,
         _prompt_run_bootstrap_within_pipeline_init_mock,
         create_interactive_flow_mock,
@@ -415,6 +530,7 @@ class TestInteractiveInitFlowWithBootstrap(TestCase):
                 Mock(id="jenkins", display_name="Jenkins"),
             ],
             templates=[jenkins_template_mock],
+            templates_by_provider={"jenkins": [jenkins_template_mock]},
         )
         PipelineTemplatesManifest_mock.return_value = pipeline_templates_manifest_mock
         cookiecutter_output_dir_mock = "/tmp/any/dir2"
@@ -454,12 +570,13 @@ class TestInteractiveInitFlowWithBootstrap(TestCase):
     @patch("samcli.commands.pipeline.init.interactive_init_flow.SamConfig")
     @patch("samcli.commands.pipeline.init.interactive_init_flow.osutils")
     @patch("samcli.lib.cookiecutter.template.cookiecutter")
-    @patch("samcli.commands.pipeline.init.interactive_init_flow.InteractiveFlowCreator.create_flow")
+    @patch("samcli.lib.cookiecutter.interactive_flow_creator.InteractiveFlowCreator.create_flow")
     @patch(
         "samcli.commands.pipeline.init.interactive_init_flow.InteractiveInitFlow._prompt_run_bootstrap_within_pipeline_init"
     )
     @patch("samcli.commands.pipeline.init.interactive_init_flow.PipelineTemplatesManifest")
-    @patch("samcli.commands.pipeline.init.interactive_init_flow.GitRepo.clone")
+    @patch("samcli.lib.utils.git_repo.GitRepo.mirror")
+    @patch("samcli.lib.utils.git_repo.GitRepo.clone")
     @patch("samcli.commands.pipeline.init.interactive_init_flow._copy_dir_contents_to_cwd")
     @patch("samcli.commands.pipeline.init.interactive_init_flow._get_pipeline_template_metadata")
     @patch("samcli.lib.cookiecutter.question.click")
@@ -471,6 +588,7 @@ class TestInteractiveInitFlowWithBootstrap(TestCase):
         _get_pipeline_template_metadata_mock,
         _copy_dir_contents_to_cwd_mock,
         clone_mock,
+        mirror_mock,
         PipelineTemplatesManifest_mock,
         _prompt_run_bootstrap_within_pipeline_init_mock,
         create_interactive_flow_mock,
@@ -493,6 +611,7 @@ class TestInteractiveInitFlowWithBootstrap(TestCase):
                 Mock(id="jenkins", display_name="Jenkins"),
             ],
             templates=[jenkins_template_mock],
+            templates_by_provider={"jenkins": [jenkins_template_mock]},
         )
         PipelineTemplatesManifest_mock.return_value = pipeline_templates_manifest_mock
         cookiecutter_output_dir_mock = "/tmp/any/dir2"
@@ -528,6 +647,7 @@ class TestInteractiveInitFlow_copy_dir_contents_to_cwd(TestCase):
     def tearDown(self) -> None:
         if Path("file").exists():
             Path("file").unlink()
+        shutil.rmtree("nested", ignore_errors=True)
         shutil.rmtree(os.path.join(".aws-sam", "pipeline"), ignore_errors=True)
 
     @patch("samcli.commands.pipeline.init.interactive_init_flow.click.confirm")
@@ -564,3 +684,29 @@ class TestInteractiveInitFlow_copy_dir_contents_to_cwd(TestCase):
             confirm_mock.assert_called_once()
             self.assertEqual("", Path("file").read_text(encoding="utf-8"))
             self.assertEqual([str(Path(".aws-sam", "pipeline", "generated-files", "file"))], file_paths)
+
+    @patch("samcli.commands.pipeline.init.interactive_init_flow.click.confirm")
+    def test_copy_dir_contents_to_cwd_moves_nested_files(self, confirm_mock):
+        with tempfile.TemporaryDirectory() as source:
+            Path(source, "nested", "dir").mkdir(parents=True)
+            Path(source, "nested", "dir", "file").write_text("hi")
+            file_paths = _copy_dir_contents_to_cwd(source)
+            confirm_mock.assert_not_called()
+            self.assertEqual("hi", Path("nested", "dir", "file").read_text(encoding="utf-8"))
+            self.assertEqual([str(Path("nested", "dir", "file"))], file_paths)
+            self.assertFalse(Path(source, "nested", "dir", "file").exists())
+
+
+class TestInteractiveInitFlow_draw_stage_diagram(TestCase):
+    @patch("samcli.commands.pipeline.init.interactive_init_flow.click")
+    def test_draw_stage_diagram(self, click_mock):
+        _draw_stage_diagram(3)
+        click_mock.echo.assert_has_calls(
+            [
+                call(" _________    _________    _________ "),
+                call("|         |  |         |  |         |"),
+                call("| Stage 1 |->| Stage 2 |->| Stage 3 |"),
+                call("|_________|  |_________|  |_________|"),
+                call(""),
+            ]
+        )
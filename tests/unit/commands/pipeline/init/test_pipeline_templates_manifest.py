@@ -80,3 +80,22 @@ class TestCli(TestCase):
         self.assertEquals(gitlab_template.display_name, "gitlab-two-environments-pipeline")
         self.assertEquals(gitlab_template.provider, "gitlab")
         self.assertEquals(gitlab_template.location, "templates/cookiecutter-gitlab-two-environments-pipeline")
+        self.assertEqual(manifest.templates_by_provider["gitlab"], [gitlab_template])
+        self.assertEqual(manifest.templates_by_provider["unknown-provider"], [])
+
+    def test_manifest_to_dict_from_dict_round_trip(self):
+        with osutils.mkdir_temp(ignore_errors=True) as tempdir:
+            manifest_path = os.path.normpath(os.path.join(tempdir, "manifest.yaml"))
+            with open(manifest_path, "w", encoding="utf-8") as fp:
+                fp.write(VALID_MANIFEST)
+            manifest = PipelineTemplatesManifest(manifest_path=Path(manifest_path))
+        loaded_manifest = PipelineTemplatesManifest.from_dict(manifest.to_dict(), Path(manifest_path))
+        self.assertEqual(loaded_manifest.to_dict(), manifest.to_dict())
+        self.assertEqual([p.id for p in loaded_manifest.providers], ["jenkins", "gitlab", "github-actions"])
+        self.assertEqual(
+            loaded_manifest.templates[1].location, "templates/cookiecutter-gitlab-two-environments-pipeline"
+        )
+
+    def test_manifest_from_dict_missing_required_keys(self):
+        with self.assertRaises(AppPipelineTemplateManifestException):
+            PipelineTemplatesManifest.from_dict({"providers": []}, Path("manifest.yaml"))
@@ -60,7 +60,7 @@ class TestInteractiveFlow(TestCase):
         mock_2nd_q.return_value = False
         mock_3rd_q.return_value = "option1"
 
-        initial_context = {"key": "value", "['beta', 'bootstrap', 'x']": "y"}
+        initial_context = {"key": "value", ("beta", "bootstrap", "x"): "y"}
 
         actual_context = self.flow.run(initial_context)
 
@@ -69,7 +69,7 @@ class TestInteractiveFlow(TestCase):
         mock_3rd_q.assert_called_once()
 
         self.assertEqual(
-            {"1st": "answer1", "2nd": False, "3rd": "option1", "['beta', 'bootstrap', 'x']": "y", "key": "value"},
+            {"1st": "answer1", "2nd": False, "3rd": "option1", ("beta", "bootstrap", "x"): "y", "key": "value"},
             actual_context,
         )
         self.assertIsNot(actual_context, initial_context)  # shouldn't modify the input, it should copy and return new
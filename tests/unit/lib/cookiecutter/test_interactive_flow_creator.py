@@ -1,6 +1,6 @@
 import os
+import tempfile
 from unittest import TestCase
-from unittest.mock import patch
 from samcli.lib.cookiecutter.interactive_flow_creator import (
     InteractiveFlowCreator,
     QuestionsNotFoundException,
@@ -48,9 +48,18 @@ class TestInteractiveFlowCreator(TestCase):
             questions_path = os.path.join(os.path.dirname(__file__), "not-existing-file.yaml")
             InteractiveFlowCreator.create_flow(flow_definition_path=questions_path)
 
-    @patch("samcli.lib.cookiecutter.interactive_flow_creator.parse_yaml_file")
-    def test_parsing_exceptions_of_questions_definition_parsing(self, mock_parse_yaml_file):
-        with self.assertRaises(QuestionsFailedParsingException):
-            questions_path = os.path.join(os.path.dirname(__file__), "questions.json")
-            mock_parse_yaml_file.side_effect = ValueError
-            InteractiveFlowCreator.create_flow(flow_definition_path=questions_path)
+    def test_parsing_exceptions_of_questions_definition_parsing(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            questions_path = os.path.join(tempdir, "questions.json")
+            with open(questions_path, "w", encoding="utf-8") as fp:
+                fp.write('{"questions": [')
+            with self.assertRaises(QuestionsFailedParsingException):
+                InteractiveFlowCreator.create_flow(flow_definition_path=questions_path)
+
+    def test_create_flow_from_yaml_questions_definition(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            questions_path = os.path.join(tempdir, "questions.yaml")
+            with open(questions_path, "w", encoding="utf-8") as fp:
+                fp.write("questions:\n  - key: 1st\n    question: any text with %(X)s\n")
+            flow = InteractiveFlowCreator.create_flow(flow_definition_path=questions_path, extra_context={"X": "xVal"})
+        self.assertEqual(flow._questions["1st"].text, "any text with xVal")
@@ -89,7 +89,7 @@ class TestQuestion(TestCase):
         previous_question_key = "this is a question"
         previous_question_answer = "this is an answer"
         context = {
-            "['x', 'this is an answer']": expected_default_value,
+            ("x", "this is an answer"): expected_default_value,
             previous_question_key: previous_question_answer,
         }
         question = self.get_question_with_default_from_cookiecutter_context_using_keypath(
@@ -120,7 +120,7 @@ class TestQuestion(TestCase):
         previous_question_key = "this is a question"
         previous_question_answer = "this is an answer"
         context = {
-            "['x', 'this is an answer']": expected_default_value,
+            ("x", "this is an answer"): expected_default_value,
             previous_question_key: previous_question_answer,
         }
         question = self.get_question_with_default_from_cookiecutter_context_using_keypath(
@@ -63,6 +63,26 @@ class TestGitRepo(TestCase):
         shutil_mock.copytree.assert_called_with(ANY, EXPECTED_DEFAULT_CLONE_PATH, ignore=ANY)
         shutil_mock.ignore_patterns.assert_called_with("*.git")
 
+    @patch("samcli.lib.utils.git_repo.Path.exists")
+    @patch("samcli.lib.utils.git_repo.shutil")
+    @patch("samcli.lib.utils.git_repo.check_output")
+    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
+    @patch("samcli.lib.utils.git_repo.platform.system")
+    def test_clone_shallow_single_branch(
+        self, platform_mock, popen_mock, check_output_mock, shutil_mock, path_exist_mock
+    ):
+        path_exist_mock.return_value = False
+        self.repo.clone(clone_dir=self.local_clone_dir, clone_name=REPO_NAME, depth=1, single_branch=True)
+        check_output_mock.assert_has_calls(
+            [
+                call(
+                    ["git", "clone", "--depth", "1", "--single-branch", self.repo.url, REPO_NAME],
+                    cwd=ANY,
+                    stderr=subprocess.STDOUT,
+                )
+            ]
+        )
+
     @patch("samcli.lib.utils.git_repo.Path.exists")
     @patch("samcli.lib.utils.git_repo.shutil")
     @patch("samcli.lib.utils.git_repo.check_output")
@@ -186,3 +206,48 @@ class TestGitRepo(TestCase):
         shutil_mock.rmtree.assert_called_once_with(EXPECTED_DEFAULT_CLONE_PATH, onerror=rmtree_callback)
         shutil_mock.copytree.assert_called_once_with(ANY, EXPECTED_DEFAULT_CLONE_PATH, ignore=ANY)
         shutil_mock.ignore_patterns.assert_called_once_with("*.git")
+
+    @patch("samcli.lib.utils.git_repo.Path.exists")
+    @patch("samcli.lib.utils.git_repo.shutil")
+    @patch("samcli.lib.utils.git_repo.check_output")
+    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
+    @patch("samcli.lib.utils.git_repo.platform.system")
+    def test_mirror_create_new_local_mirror(
+        self, platform_mock, popen_mock, check_output_mock, shutil_mock, path_exist_mock
+    ):
+        path_exist_mock.return_value = False
+        mirror_path = self.repo.mirror(mirror_dir=self.local_clone_dir, mirror_name=REPO_NAME)
+        self.local_clone_dir.mkdir.assert_called_once_with(mode=0o700, parents=True, exist_ok=True)
+        check_output_mock.assert_called_once_with(
+            ["git", "clone", "--mirror", self.repo.url, REPO_NAME], cwd=ANY, stderr=subprocess.STDOUT
+        )
+        shutil_mock.move.assert_called_once_with(ANY, EXPECTED_DEFAULT_CLONE_PATH)
+        self.assertEqual(mirror_path, Path(EXPECTED_DEFAULT_CLONE_PATH))
+        self.assertTrue(self.repo.clone_attempted)
+
+    @patch("samcli.lib.utils.git_repo.Path.exists")
+    @patch("samcli.lib.utils.git_repo.shutil")
+    @patch("samcli.lib.utils.git_repo.check_output")
+    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
+    @patch("samcli.lib.utils.git_repo.platform.system")
+    def test_mirror_update_existing_local_mirror(
+        self, platform_mock, popen_mock, check_output_mock, shutil_mock, path_exist_mock
+    ):
+        path_exist_mock.return_value = True
+        mirror_path = self.repo.mirror(mirror_dir=self.local_clone_dir, mirror_name=REPO_NAME)
+        self.local_clone_dir.mkdir.assert_not_called()
+        check_output_mock.assert_called_once_with(
+            ["git", "remote", "update", "--prune"], cwd=EXPECTED_DEFAULT_CLONE_PATH, stderr=subprocess.STDOUT
+        )
+        shutil_mock.move.assert_not_called()
+        self.assertEqual(mirror_path, Path(EXPECTED_DEFAULT_CLONE_PATH))
+
+    @patch("samcli.lib.utils.git_repo.Path.exists")
+    @patch("samcli.lib.utils.git_repo.check_output")
+    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
+    @patch("samcli.lib.utils.git_repo.platform.system")
+    def test_mirror_when_the_subprocess_fail(self, platform_mock, popen_mock, check_output_mock, path_exist_mock):
+        path_exist_mock.return_value = True
+        check_output_mock.side_effect = subprocess.CalledProcessError("fail", "fail", "any reason".encode("utf-8"))
+        with self.assertRaises(CloneRepoException):
+            self.repo.mirror(mirror_dir=self.local_clone_dir, mirror_name=REPO_NAME)